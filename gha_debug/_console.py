@@ -0,0 +1,6 @@
+"""Shared rich console used for all CLI output."""
+
+from rich.console import Console
+
+# Output is plain text with explicit markup, so skip rich's regex highlighter
+console = Console(force_terminal=True, highlight=False)
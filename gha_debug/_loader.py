@@ -0,0 +1,48 @@
+"""Load a workflow file once for all the commands that consume it."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+from gha_debug._yamlcache import load_yaml
+
+
+@dataclass
+class LoadedWorkflow:
+    """A workflow file read and parsed by a single libyaml pass.
+
+    Attributes:
+        path: Path to the workflow YAML file
+        raw_bytes: Raw file content
+        data: Parsed YAML document, or None if the file is not valid YAML
+        yaml_error: The YAML error raised while parsing, if any
+    """
+
+    path: Path
+    raw_bytes: bytes
+    data: Any
+    yaml_error: Optional[yaml.YAMLError] = None
+
+
+def load(path: Path) -> LoadedWorkflow:
+    """Read and parse a workflow file.
+
+    YAML errors are kept on the result rather than raised, so that the
+    parser and the validator can each report them in their own way.
+
+    Args:
+        path: Path to the workflow YAML file
+
+    Returns:
+        The loaded workflow
+
+    Raises:
+        FileNotFoundError: If the workflow file doesn't exist
+    """
+    try:
+        raw_bytes, data = load_yaml(path)
+    except yaml.YAMLError as e:
+        return LoadedWorkflow(path, path.read_bytes(), None, e)
+    return LoadedWorkflow(path, raw_bytes, data)
@@ -0,0 +1,72 @@
+"""In-process cache of parsed workflow YAML files."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Tuple
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml.
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[bytes, Any]:
+    """Read and parse a workflow file.
+
+    The modification time and size are unused in the body; they are part of
+    the cache key so an edited file is parsed again instead of served stale.
+
+    Args:
+        path_str: Path to the workflow YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Tuple of the raw file bytes and the parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    raw_content = Path(path_str).read_bytes()
+    return raw_content, yaml.load(raw_content, Loader=_LOADER)
+
+
+def load_yaml(path: Path) -> Tuple[bytes, Any]:
+    """Load a workflow file, reusing the parse result while it is unchanged.
+
+    The returned document is shared between callers and must not be mutated;
+    the validator only reads it and the parser copies the values it keeps.
+
+    Args:
+        path: Path to the workflow YAML file
+
+    Returns:
+        Tuple of the raw file bytes and the parsed YAML document
+
+    Raises:
+        FileNotFoundError: If the workflow file doesn't exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    st = os.stat(path)
+    return _parse_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def load_yaml_text(text: str) -> Any:
+    """Parse workflow YAML held in memory, reusing results for identical text.
+
+    The returned document is shared between callers and must not be mutated;
+    the validator only reads it and the parser copies the values it keeps.
+
+    Args:
+        text: Workflow YAML content
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    return yaml.load(text, Loader=_LOADER)
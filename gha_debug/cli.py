@@ -1,19 +1,36 @@
 """CLI interface for gha-debug."""
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import click
-from rich.console import Console
 
 from gha_debug import __version__
-from gha_debug.formatter import Formatter
-from gha_debug.parser import WorkflowParser
-from gha_debug.runner import WorkflowRunner
-from gha_debug.validator import WorkflowValidator
+from gha_debug._console import console
 
-console = Console(force_terminal=True)
+# Subcommand dependencies (yaml, subprocess, the runner, ...) are imported inside
+# each command so that --help and --version don't pay for them.
+
+_WORKFLOW_SUFFIXES = (".yml", ".yaml")
+
+
+def _find_workflows(directory: Path) -> List[Path]:
+    """Find workflow files in a directory with a single scan.
+
+    Args:
+        directory: Directory to search
+
+    Returns:
+        Sorted list of workflow file paths
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(_WORKFLOW_SUFFIXES) and entry.is_file()
+        )
 
 
 @click.group()
@@ -25,9 +42,18 @@ def cli() -> None:
 @cli.command()
 @click.argument("workflow_path", type=click.Path(exists=True))
 @click.option("--job", "-j", help="Specific job to run")
-@click.option("--verbose", "-v", is_flag=True, help="Show verbose output")
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show verbose output (buffered per job when several jobs run in parallel)",
+)
 def run(workflow_path: str, job: Optional[str], verbose: bool) -> None:
     """Run a GitHub Actions workflow locally."""
+    from gha_debug.formatter import Formatter
+    from gha_debug.parser import WorkflowParser
+    from gha_debug.runner import WorkflowRunner
+
     try:
         path = Path(workflow_path)
         parser = WorkflowParser(path)
@@ -51,17 +77,21 @@ def run(workflow_path: str, job: Optional[str], verbose: bool) -> None:
         sys.exit(1)
 
 
-@cli.command()
+@cli.command(name="list")
 @click.argument("workflow_path", type=click.Path(exists=False), default=".github/workflows")
-def list(workflow_path: str) -> None:
+def list_workflows(workflow_path: str) -> None:
     """List all workflows, jobs, and steps."""
+    from gha_debug._loader import load
+    from gha_debug.formatter import Formatter
+    from gha_debug.parser import WorkflowParser
+
     try:
         path = Path(workflow_path)
 
         if path.is_file():
             workflow_files = [path]
         elif path.is_dir():
-            workflow_files = sorted(path.glob("*.yml")) + sorted(path.glob("*.yaml"))
+            workflow_files = _find_workflows(path)
         else:
             console.print(f"[yellow]Warning:[/yellow] Path not found: {workflow_path}")
             sys.exit(1)
@@ -72,8 +102,8 @@ def list(workflow_path: str) -> None:
 
         formatter = Formatter()
 
-        for wf_path in sorted(workflow_files):
-            parser = WorkflowParser(wf_path)
+        for wf_path in workflow_files:
+            parser = WorkflowParser(load(wf_path))
             workflow = parser.parse()
             formatter.print_workflow_structure(workflow, wf_path)
             console.print()
@@ -87,6 +117,9 @@ def list(workflow_path: str) -> None:
 @click.option("--job", "-j", help="Specific job to show environment for")
 def env(workflow_path: str, job: Optional[str]) -> None:
     """Display environment variables and contexts for a workflow."""
+    from gha_debug.formatter import Formatter
+    from gha_debug.parser import WorkflowParser
+
     try:
         path = Path(workflow_path)
         parser = WorkflowParser(path)
@@ -104,60 +137,78 @@ def env(workflow_path: str, job: Optional[str]) -> None:
 @click.option("--html", is_flag=True, help="Generate HTML report and open in browser")
 def validate(workflow_paths: tuple, html: bool) -> None:
     """Validate workflow syntax and catch common errors."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from gha_debug._loader import load
+    from gha_debug.parser import WorkflowParser
+    from gha_debug.validator import WorkflowValidator
+
     try:
         validator = WorkflowValidator()
         all_valid = True
         workflow_results = []
 
+        files = []
         for workflow_path in workflow_paths:
             path = Path(workflow_path)
 
             if path.is_dir():
-                files = list(path.glob("*.yml")) + list(path.glob("*.yaml"))
+                files.extend(_find_workflows(path))
             else:
-                files = [path]
-
-            for file_path in files:
-                errors = validator.validate(file_path)
-
-                # Parse workflow for structure info
-                try:
-                    parser = WorkflowParser(file_path)
-                    workflow = parser.parse()
-                    wf_name = workflow.get("name", file_path.stem)
-                    jobs_data = []
-                    for job_id, job in workflow.get("jobs", {}).items():
-                        steps_data = []
-                        for step in job.get("steps", []):
-                            steps_data.append({
-                                "name": step.get("name", ""),
-                                "uses": step.get("uses", ""),
-                                "run": step.get("run", ""),
-                            })
-                        jobs_data.append({
-                            "name": job_id,
-                            "runs_on": job.get("runs-on", "?"),
-                            "steps": steps_data,
+                files.append(path)
+
+        # Load each file once; the validator and the parser share the result
+        def load_and_validate(file_path: Path) -> tuple:
+            loaded = load(file_path)
+            return loaded, validator.validate(loaded)
+
+        # Files are independent, so validate them concurrently and report in order
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            all_results = list(executor.map(load_and_validate, files))
+
+        for file_path, (loaded, errors) in zip(files, all_results):
+            # Parse workflow for structure info
+            try:
+                parser = WorkflowParser(loaded)
+                workflow = parser.parse()
+                wf_name = workflow["name"]
+                jobs_data = []
+                for job in workflow["jobs"]:
+                    steps_data = []
+                    for step in job["steps"]:
+                        steps_data.append({
+                            "name": step["name"],
+                            "uses": step["uses"] or "",
+                            "run": step["run"] or "",
                         })
-                except Exception:
-                    wf_name = file_path.stem
-                    jobs_data = []
-
-                workflow_results.append({
-                    "file": str(file_path),
-                    "name": wf_name,
-                    "valid": len(errors) == 0,
-                    "errors": errors,
-                    "jobs": jobs_data,
-                })
-
-                if errors:
+                    jobs_data.append({
+                        "name": job["id"],
+                        "runs_on": job["runs-on"],
+                        "steps": steps_data,
+                    })
+            except Exception:
+                wf_name = file_path.stem
+                jobs_data = []
+
+            workflow_results.append({
+                "file": str(file_path),
+                "name": wf_name,
+                "valid": len(errors) == 0,
+                "errors": errors,
+                "jobs": jobs_data,
+            })
+
+        # Buffer the per-file lines so they reach the terminal in one write
+        with console:
+            for result in workflow_results:
+                if result["errors"]:
                     all_valid = False
-                    console.print(f"\n[red]✗[/red] {file_path}")
-                    for error in errors:
+                    console.print(f"\n[red]✗[/red] {result['file']}")
+                    for error in result["errors"]:
                         console.print(f"  [red]•[/red] {error}")
                 else:
-                    console.print(f"[green]OK[/green] {str(file_path)}")
+                    console.print(f"[green]OK[/green] {result['file']}")
 
         if html:
             import webbrowser
@@ -3,10 +3,9 @@
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from rich.console import Console
 from rich.table import Table
 
-console = Console(force_terminal=True)
+from gha_debug._console import console
 
 
 class Formatter:
@@ -80,23 +79,25 @@ class Formatter:
             workflow: Parsed workflow dictionary
             job_filter: Optional job ID to filter by
         """
-        table = Table(title="Environment Variables")
-        table.add_column("Scope", style="cyan")
-        table.add_column("Variable", style="green")
-        table.add_column("Value", style="yellow")
-
-        for key, value in workflow.get("env", {}).items():
-            table.add_row("Workflow", key, str(value))
+        rows = [("Workflow", key, str(value)) for key, value in workflow.get("env", {}).items()]
 
         for job in workflow["jobs"]:
             if job_filter and job["id"] != job_filter:
                 continue
 
-            for key, value in job.get("env", {}).items():
-                table.add_row(f"Job: {job['id']}", key, str(value))
+            scope = f"Job: {job['id']}"
+            rows.extend((scope, key, str(value)) for key, value in job.get("env", {}).items())
+
+        rows.append(("Default", "CI", "true"))
+        rows.append(("Default", "GITHUB_ACTIONS", "true"))
+        rows.append(("Default", "GITHUB_WORKFLOW", workflow["name"]))
+
+        table = Table(title="Environment Variables")
+        table.add_column("Scope", style="cyan")
+        table.add_column("Variable", style="green")
+        table.add_column("Value", style="yellow")
 
-        table.add_row("Default", "CI", "true")
-        table.add_row("Default", "GITHUB_ACTIONS", "true")
-        table.add_row("Default", "GITHUB_WORKFLOW", workflow["name"])
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
@@ -1,20 +1,73 @@
 """YAML parsing logic for GitHub Actions workflows."""
 
+import copy
+import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+from gha_debug._loader import LoadedWorkflow, load
+from gha_debug._yamlcache import load_yaml_text
+
+# Set GHA_DEBUG_CACHE=1 to keep a parsed copy of each workflow next to it
+_CACHE_ENV_VAR = "GHA_DEBUG_CACHE"
+_CACHE_SUFFIX = ".cache.json"
+# Bump whenever the parsed workflow's shape changes, so old sidecars are ignored
+_CACHE_VERSION = 1
+
+# Keys of each level of the parsed workflow, checked before trusting a sidecar
+_WORKFLOW_KEYS = {"name", "env", "jobs"}
+_JOB_KEYS = {"id", "name", "runs-on", "env", "needs", "steps"}
+_STEP_KEYS = {"name", "uses", "run", "env", "with"}
+
+
+def _is_parsed_workflow(workflow: Any) -> bool:
+    """Check that a value has the shape of WorkflowParser output.
+
+    Args:
+        workflow: Value loaded from a JSON sidecar
+
+    Returns:
+        True if every key the CLI, runner and formatter read is present
+    """
+    if not isinstance(workflow, dict) or not _WORKFLOW_KEYS <= workflow.keys():
+        return False
+    if not isinstance(workflow["env"], dict) or not isinstance(workflow["jobs"], list):
+        return False
+
+    for job in workflow["jobs"]:
+        if not isinstance(job, dict) or not _JOB_KEYS <= job.keys():
+            return False
+        if not isinstance(job["env"], dict) or not isinstance(job["needs"], list):
+            return False
+        if not isinstance(job["steps"], list):
+            return False
+        for step in job["steps"]:
+            if not isinstance(step, dict) or not _STEP_KEYS <= step.keys():
+                return False
+            if not isinstance(step["env"], dict):
+                return False
+
+    return True
+
 
 class WorkflowParser:
     """Parse GitHub Actions workflow YAML files."""
 
-    def __init__(self, workflow_path: Path):
+    def __init__(self, workflow_path: Union[Path, LoadedWorkflow]):
         """Initialize the parser with a workflow file path.
 
         Args:
-            workflow_path: Path to the workflow YAML file
+            workflow_path: Path to the workflow YAML file, or an already
+                loaded workflow to reuse its parsed YAML
         """
+        self._loaded: Optional[LoadedWorkflow] = None
+        if isinstance(workflow_path, LoadedWorkflow):
+            self._loaded = workflow_path
+            workflow_path = workflow_path.path
         self.workflow_path = workflow_path
 
     def parse(self) -> Dict[str, Any]:
@@ -27,21 +80,133 @@ class WorkflowParser:
             ValueError: If the workflow file is invalid
             FileNotFoundError: If the workflow file doesn't exist
         """
-        if not self.workflow_path.exists():
-            raise FileNotFoundError(f"Workflow file not found: {self.workflow_path}")
+        loaded = self._loaded
+        use_cache = loaded is None and os.environ.get(_CACHE_ENV_VAR) == "1"
+        if loaded is None:
+            if not self.workflow_path.exists():
+                raise FileNotFoundError(f"Workflow file not found: {self.workflow_path}")
+            if use_cache:
+                cached = self._read_cache()
+                if cached is not None:
+                    return cached
+            loaded = load(self.workflow_path)
+
+        if loaded.yaml_error is not None:
+            raise ValueError(f"Invalid YAML in workflow file: {loaded.yaml_error}")
+
+        workflow = self._build_workflow(loaded.data, self.workflow_path.stem)
+        if use_cache:
+            self._write_cache(workflow)
+        return workflow
+
+    def _cache_path(self) -> Path:
+        """Return the JSON sidecar path for the workflow file."""
+        return self.workflow_path.with_suffix(self.workflow_path.suffix + _CACHE_SUFFIX)
+
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the parsed workflow from its JSON sidecar.
+
+        Returns:
+            The cached workflow, or None if the sidecar is missing, older
+            than the workflow file, unreadable, from another cache version,
+            or not shaped like parser output
+        """
+        cache_path = self._cache_path()
+        try:
+            if cache_path.stat().st_mtime_ns < self.workflow_path.stat().st_mtime_ns:
+                return None
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+            return None
+
+        workflow = cached.get("workflow")
+        if not _is_parsed_workflow(workflow):
+            return None
+
+        workflow["jobs_by_id"] = {job["id"]: job for job in workflow["jobs"]}
+        return workflow
+
+    def _write_cache(self, workflow: Dict[str, Any]) -> None:
+        """Store the parsed workflow in its JSON sidecar, if possible.
+
+        The sidecar is written to a temporary file and renamed into place,
+        so a concurrent reader never sees a partly written cache.
+
+        Args:
+            workflow: Parsed workflow dictionary
+        """
+        cache_path = self._cache_path()
+        # jobs_by_id only indexes the jobs list, so it is rebuilt on load
+        data = {key: value for key, value in workflow.items() if key != "jobs_by_id"}
+        try:
+            content = json.dumps({"version": _CACHE_VERSION, "workflow": data})
+        except (TypeError, ValueError):
+            # Values JSON can't hold (e.g. YAML dates) mean no cache for this file
+            return
 
         try:
-            with open(self.workflow_path, "r") as f:
-                data = yaml.safe_load(f)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        except OSError:
+            # e.g. a read-only checkout; the workflow is parsed from YAML next time
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    @classmethod
+    def parse_string(cls, text: str, default_name: str = "workflow") -> Dict[str, Any]:
+        """Parse workflow YAML from a string instead of a file.
+
+        Args:
+            text: Workflow YAML content
+            default_name: Workflow name to use when the YAML has no 'name'
+
+        Returns:
+            Dictionary containing workflow structure with jobs and steps
+
+        Raises:
+            ValueError: If the workflow YAML is invalid
+        """
+        try:
+            data = load_yaml_text(text)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in workflow file: {e}")
 
+        return cls._build_workflow(data, default_name)
+
+    @staticmethod
+    def _build_workflow(data: Any, default_name: str) -> Dict[str, Any]:
+        """Extract workflow structure from a parsed YAML document.
+
+        The YAML document may be shared through the parse cache, so it is
+        deep-copied once up front and the result never aliases the cache.
+
+        Args:
+            data: Parsed YAML document
+            default_name: Workflow name to use when the YAML has no 'name'
+
+        Returns:
+            Dictionary containing workflow structure with jobs and steps
+
+        Raises:
+            ValueError: If the document is not a dictionary
+        """
         if not isinstance(data, dict):
             raise ValueError("Workflow file must contain a YAML dictionary")
 
-        workflow_name = data.get("name", self.workflow_path.stem)
+        data = copy.deepcopy(data)
+        workflow_name = data.get("name", default_name)
         jobs = data.get("jobs", {})
-        env = data.get("env", {})
+        env = data.get("env") or {}
 
         parsed_jobs = []
         for job_id, job_data in jobs.items():
@@ -55,20 +220,28 @@ class WorkflowParser:
                 if not isinstance(step, dict):
                     continue
 
-                step_name = step.get("name", step.get("uses", step.get("run", "Unnamed step")))
+                step_name = step.get("name") or step.get("uses") or step.get("run") or "Unnamed step"
                 parsed_steps.append({
                     "name": step_name,
                     "uses": step.get("uses"),
                     "run": step.get("run"),
-                    "env": step.get("env", {}),
+                    "env": step.get("env") or {},
                     "with": step.get("with", {}),
                 })
 
+            # needs may be omitted, left empty, a single job ID or a list of them
+            needs = job_data.get("needs")
+            if needs is None:
+                needs = []
+            elif not isinstance(needs, list):
+                needs = [needs]
+
             parsed_jobs.append({
                 "id": job_id,
                 "name": job_data.get("name", job_id),
                 "runs-on": job_data.get("runs-on", "ubuntu-latest"),
-                "env": job_data.get("env", {}),
+                "env": job_data.get("env") or {},
+                "needs": needs,
                 "steps": parsed_steps,
             })
 
@@ -76,6 +249,7 @@ class WorkflowParser:
             "name": workflow_name,
             "env": env,
             "jobs": parsed_jobs,
+            "jobs_by_id": {job["id"]: job for job in parsed_jobs},
         }
 
     def get_job(self, workflow: Dict[str, Any], job_id: str) -> Dict[str, Any]:
@@ -91,7 +265,7 @@ class WorkflowParser:
         Raises:
             ValueError: If job not found
         """
-        for job in workflow["jobs"]:
-            if job["id"] == job_id:
-                return job
-        raise ValueError(f"Job '{job_id}' not found in workflow")
+        try:
+            return workflow["jobs_by_id"][job_id]
+        except KeyError:
+            raise ValueError(f"Job '{job_id}' not found in workflow")
@@ -1,12 +1,25 @@
 """HTML report generator for gha-debug validation results."""
 
 import os
+import string
 import tempfile
 from datetime import datetime, timezone
 
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
-def _base_style():
-    return """
+
+def _escape(value):
+    """Escape a value for HTML text or a quoted attribute in a single pass."""
+    return str(value or "").translate(_HTML_ESCAPE)
+
+
+_BASE_STYLE = """
     :root {
         --bg: #0d1117; --card: #161b22; --border: #30363d;
         --text: #e6edf3; --muted: #8b949e;
@@ -45,7 +58,52 @@ def _base_style():
     .footer { text-align:center; color:var(--muted); font-size:0.8rem; margin-top:2rem; padding-top:1rem; border-top:1px solid var(--border); }
     .footer a { color:var(--blue); text-decoration:none; }
     .error-item { padding:0.5rem 0.8rem; margin:0.3rem 0; background:rgba(248,81,73,0.08); border-left:3px solid var(--red); border-radius:0 4px 4px 0; }
-    """
+"""
+
+
+# Outer page, compiled once; sections are substituted per report
+_PAGE_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>gha-debug Validation Report</title>
+<style>$style</style>
+</head>
+<body>
+
+<div class="header">
+    <h1>gha-debug Validation Report</h1>
+    <div class="subtitle">GitHub Actions Workflow Analysis &mdash; $now</div>
+</div>
+
+<div class="cards">
+    <div class="card">
+        <div class="label">Status</div>
+        <div class="value $status_class">$status</div>
+    </div>
+    <div class="card">
+        <div class="label">Workflows</div>
+        <div class="value">$total_files</div>
+    </div>
+    <div class="card">
+        <div class="label">Jobs</div>
+        <div class="value">$total_jobs</div>
+    </div>
+    <div class="card">
+        <div class="label">Steps</div>
+        <div class="value">$total_steps</div>
+    </div>
+</div>
+
+$workflows_html
+
+<div class="footer">
+    <p>Generated by <a href="https://pypi.org/project/gha-debug/">gha-debug</a> &mdash; GitHub Actions workflow debugger</p>
+</div>
+
+</body>
+</html>""")
 
 
 def generate_html(workflow_results):
@@ -71,83 +129,51 @@ def generate_html(workflow_results):
     status_class = "pass" if all_valid else "fail"
 
     # Build workflow sections
-    workflows_html = ""
+    workflow_parts = []
     for wf in workflow_results:
         icon = "<span style='color:var(--green)'>&#10004;</span>" if wf["valid"] else "<span style='color:var(--red)'>&#10008;</span>"
 
         errors_html = ""
         if wf["errors"]:
-            errors_html = "<div style='margin-top:0.8rem'>"
-            for err in wf["errors"]:
-                errors_html += f'<div class="error-item">{err}</div>'
-            errors_html += "</div>"
+            error_parts = [f'<div class="error-item">{_escape(err)}</div>' for err in wf["errors"]]
+            errors_html = "<div style='margin-top:0.8rem'>" + "".join(error_parts) + "</div>"
 
-        jobs_html = ""
+        job_parts = []
         for job in wf.get("jobs", []):
-            steps_html = ""
+            step_parts = []
             for step in job.get("steps", []):
                 if step.get("uses"):
-                    steps_html += f'<li class="action"><span class="badge badge-action">action</span> <span class="mono">{step["uses"]}</span></li>'
+                    step_parts.append(f'<li class="action"><span class="badge badge-action">action</span> <span class="mono">{_escape(step["uses"])}</span></li>')
                 elif step.get("run"):
-                    cmd = step["run"][:80]
-                    steps_html += f'<li><span class="badge badge-step">run</span> <span class="mono">{cmd}</span></li>'
+                    cmd = _escape(str(step["run"])[:80])
+                    step_parts.append(f'<li><span class="badge badge-step">run</span> <span class="mono">{cmd}</span></li>')
+            steps_html = "".join(step_parts)
 
-            jobs_html += f"""
+            job_parts.append(f"""
             <div class="job-card">
-                <div class="job-title">{job["name"]} <span style="color:var(--muted); font-weight:normal; font-size:0.85rem;">({job.get("runs_on", "?")})</span></div>
+                <div class="job-title">{_escape(job["name"])} <span style="color:var(--muted); font-weight:normal; font-size:0.85rem;">({_escape(job.get("runs_on", "?"))})</span></div>
                 <ul class="step-list">{steps_html}</ul>
-            </div>"""
+            </div>""")
+        jobs_html = "".join(job_parts)
 
-        workflows_html += f"""
+        workflow_parts.append(f"""
         <div class="section">
-            <h2>{icon} {wf["name"]} <span style="color:var(--muted); font-size:0.85rem; font-weight:normal;">({os.path.basename(wf["file"])})</span></h2>
+            <h2>{icon} {_escape(wf["name"])} <span style="color:var(--muted); font-size:0.85rem; font-weight:normal;">({_escape(os.path.basename(wf["file"]))})</span></h2>
             {errors_html}
             {jobs_html}
-        </div>"""
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>gha-debug Validation Report</title>
-<style>{_base_style()}</style>
-</head>
-<body>
-
-<div class="header">
-    <h1>gha-debug Validation Report</h1>
-    <div class="subtitle">GitHub Actions Workflow Analysis &mdash; {now}</div>
-</div>
-
-<div class="cards">
-    <div class="card">
-        <div class="label">Status</div>
-        <div class="value {status_class}">{status}</div>
-    </div>
-    <div class="card">
-        <div class="label">Workflows</div>
-        <div class="value">{total_files}</div>
-    </div>
-    <div class="card">
-        <div class="label">Jobs</div>
-        <div class="value">{total_jobs}</div>
-    </div>
-    <div class="card">
-        <div class="label">Steps</div>
-        <div class="value">{total_steps}</div>
-    </div>
-</div>
-
-{workflows_html}
-
-<div class="footer">
-    <p>Generated by <a href="https://pypi.org/project/gha-debug/">gha-debug</a> &mdash; GitHub Actions workflow debugger</p>
-</div>
-
-</body>
-</html>"""
-    return html
+        </div>""")
+    workflows_html = "".join(workflow_parts)
+
+    return _PAGE_TEMPLATE.substitute(
+        style=_BASE_STYLE,
+        now=now,
+        status=status,
+        status_class=status_class,
+        total_files=total_files,
+        total_jobs=total_jobs,
+        total_steps=total_steps,
+        workflows_html=workflows_html,
+    )
 
 
 def export_html(workflow_results, output_path=None):
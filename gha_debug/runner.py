@@ -3,13 +3,15 @@
 import os
 import subprocess
 import time
-from typing import Any, Dict, List, Optional
-
-from rich.console import Console
+from collections import ChainMap, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple
 
+from gha_debug._console import console
 from gha_debug.formatter import Formatter
 
-console = Console()
+# Number of output lines kept from a quiet step to show when it fails
+OUTPUT_TAIL_LINES = 50
 
 
 class WorkflowRunner:
@@ -24,7 +26,11 @@ class WorkflowRunner:
         """
         self.workflow = workflow
         self.verbose = verbose
+        # Workflows built by hand rather than by WorkflowParser may lack the index
+        self._jobs_by_id = workflow.get("jobs_by_id") or {job["id"]: job for job in workflow["jobs"]}
         self.formatter = Formatter()
+        # Snapshot the parent environment once instead of copying it per step
+        self._parent_env = dict(os.environ)
 
     def run(self, job_filter: Optional[str] = None) -> Dict[str, Any]:
         """Run the workflow or a specific job.
@@ -35,34 +41,147 @@ class WorkflowRunner:
         Returns:
             Dictionary with success status and timing information
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         jobs_to_run = self.workflow["jobs"]
         if job_filter:
-            jobs_to_run = [j for j in jobs_to_run if j["id"] == job_filter]
-            if not jobs_to_run:
+            job = self._jobs_by_id.get(job_filter)
+            if job is None:
                 return {
                     "success": False,
                     "error": f"Job '{job_filter}' not found",
                     "total_time": 0,
                 }
-
-        for job in jobs_to_run:
-            success = self._run_job(job)
-            if not success:
-                total_time = time.time() - start_time
-                return {
-                    "success": False,
-                    "error": f"Job '{job['id']}' failed",
-                    "total_time": total_time,
-                }
-
-        total_time = time.time() - start_time
+            jobs_to_run = [job]
+
+        error = self._run_jobs(jobs_to_run)
+        if error:
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return {
+                "success": False,
+                "error": error,
+                "total_time": total_time,
+            }
+
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         return {
             "success": True,
             "total_time": total_time,
         }
 
+    def _run_jobs(self, jobs: List[Dict[str, Any]]) -> Optional[str]:
+        """Run jobs in dependency order, running independent jobs concurrently.
+
+        A job starts once every job it needs has succeeded, and once a job
+        fails no further jobs are started. A single job (e.g. one selected with
+        ``--job``) runs straight away, ignoring its needs. Otherwise needs must
+        name jobs in ``jobs``; nothing is run if one doesn't.
+
+        Each job's output is buffered and written in dependency order (ties
+        broken by declaration order), so the output doesn't depend on which
+        job happens to finish first.
+
+        Args:
+            jobs: Job dictionaries to run
+
+        Returns:
+            Error message for the first failure, or None if all jobs succeeded
+        """
+        if len(jobs) == 1:
+            return None if self._run_job(jobs[0]) else f"Job '{jobs[0]['id']}' failed"
+
+        pending = {job["id"]: job for job in jobs}
+        for job in jobs:
+            for need in job.get("needs", []):
+                if need not in pending:
+                    return f"Job '{job['id']}' needs unknown job '{need}'"
+
+        done = set()
+        error: Optional[str] = None
+
+        display_order = self._display_order(jobs)
+        outputs: Dict[str, str] = {}
+        next_output = 0
+
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running: Dict[Future, str] = {}
+            while True:
+                if error is None:
+                    for job_id, job in list(pending.items()):
+                        if all(need in done for need in job.get("needs", [])):
+                            del pending[job_id]
+                            running[executor.submit(self._run_job_captured, job)] = job_id
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job_id = running.pop(future)
+                    success, outputs[job_id] = future.result()
+                    if success:
+                        done.add(job_id)
+                    elif error is None:
+                        error = f"Job '{job_id}' failed"
+
+                # Only this thread writes to the terminal, so job output never interleaves
+                while next_output < len(display_order) and display_order[next_output] in outputs:
+                    console.file.write(outputs.pop(display_order[next_output]))
+                    next_output += 1
+                console.file.flush()
+
+        # Jobs that were never started leave gaps; write what the rest printed
+        for job_id in display_order[next_output:]:
+            console.file.write(outputs.pop(job_id, ""))
+        console.file.flush()
+
+        if error is None and pending:
+            error = f"Jobs with unresolvable needs: {', '.join(pending)}"
+        return error
+
+    @staticmethod
+    def _display_order(jobs: List[Dict[str, Any]]) -> List[str]:
+        """Order job IDs so that every job comes after the jobs it needs.
+
+        Args:
+            jobs: Job dictionaries, in declaration order
+
+        Returns:
+            Job IDs in dependency order; jobs in a needs cycle come last
+        """
+        remaining = list(jobs)
+        order: List[str] = []
+        placed: Set[str] = set()
+
+        while remaining:
+            ready = [
+                job for job in remaining
+                if all(need in placed for need in job.get("needs", []))
+            ]
+            if not ready:
+                order.extend(job["id"] for job in remaining)
+                break
+            for job in ready:
+                order.append(job["id"])
+                placed.add(job["id"])
+            remaining = [job for job in remaining if job["id"] not in placed]
+
+        return order
+
+    def _run_job_captured(self, job: Dict[str, Any]) -> Tuple[bool, str]:
+        """Run a single job in a worker thread, buffering its console output.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            Tuple of the job's success and its rendered output
+        """
+        with console.capture() as capture:
+            success = self._run_job(job)
+        return success, capture.get()
+
     def _run_job(self, job: Dict[str, Any]) -> bool:
         """Run a single job.
 
@@ -88,14 +207,17 @@ class WorkflowRunner:
 
         Args:
             step: Step dictionary
-            env: Environment variables
+            env: Job environment variables, shared by all steps of the job
 
         Returns:
             True if step succeeded, False otherwise
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        step_env = {**env, **step.get("env", {})}
+        # Overlay step-level env on the job env instead of copying it per step
+        step_env: Mapping[str, str] = env
+        if step.get("env"):
+            step_env = ChainMap({k: str(v) for k, v in step["env"].items()}, env)
 
         if step.get("uses"):
             success = self._run_action(step, step_env)
@@ -104,7 +226,7 @@ class WorkflowRunner:
         else:
             success = True
 
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
 
         if success:
             self.formatter.print_step_success(step["name"], elapsed)
@@ -113,7 +235,7 @@ class WorkflowRunner:
 
         return success
 
-    def _run_action(self, step: Dict[str, Any], env: Dict[str, str]) -> bool:
+    def _run_action(self, step: Dict[str, Any], env: Mapping[str, str]) -> bool:
         """Simulate running a GitHub Action.
 
         Args:
@@ -132,7 +254,7 @@ class WorkflowRunner:
 
         return True
 
-    def _run_command(self, step: Dict[str, Any], env: Dict[str, str]) -> bool:
+    def _run_command(self, step: Dict[str, Any], env: Mapping[str, str]) -> bool:
         """Run a shell command.
 
         Args:
@@ -147,20 +269,33 @@ class WorkflowRunner:
         if self.verbose:
             console.print(f"  [dim]Running: {command}[/dim]")
 
+        # In quiet mode only the last lines are kept, for the failure message
+        tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 command,
                 shell=True,
-                env={**os.environ.copy(), **env},
-                capture_output=not self.verbose,
+                env={**self._parent_env, **env},
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-            )
-
-            if result.returncode == 0:
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            ) as proc:
+                for line in proc.stdout:
+                    if self.verbose:
+                        console.out(line, end="", highlight=False)
+                    else:
+                        tail.append(line)
+                returncode = proc.wait()
+
+            if returncode == 0:
                 return True
             else:
-                if not self.verbose and result.stderr:
-                    console.print(f"  [red]{result.stderr.strip()}[/red]")
+                if tail:
+                    console.print(f"  {''.join(tail).strip()}", style="red", markup=False, highlight=False)
                 return False
         except Exception as e:
             console.print(f"  [red]Error: {str(e)}[/red]")
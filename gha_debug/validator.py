@@ -1,37 +1,107 @@
 """Workflow validation logic."""
 
+import re
 from pathlib import Path
-from typing import List
+from typing import Any, List, Union
 
 import yaml
 
+from gha_debug._loader import LoadedWorkflow, load
+from gha_debug._yamlcache import load_yaml_text
+
+# Common syntax mistakes found in the raw file, keyed by regex group name.
+# All rules are combined into one pattern so the file is scanned once.
+_SYNTAX_HINTS = {
+    "empty_expr": "Syntax hint: GitHub expressions use '${{ }}' not '${{}}'",
+}
+_SYNTAX_RE = re.compile(rb"(?P<empty_expr>\$\{\{\}\})")
+
+
+def _validate_steps(job_id: str, steps: list) -> List[str]:
+    """Check the structure of a job's steps.
+
+    Kept free of validator state so this hot loop can be compiled
+    (e.g. with mypyc) independently of the rest of the module.
+
+    Args:
+        job_id: ID of the job the steps belong to
+        steps: Raw step entries from the workflow YAML
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
+
+    for idx, step in enumerate(steps):
+        if not isinstance(step, dict):
+            errors.append(f"Job '{job_id}', step {idx}: must be a dictionary")
+            continue
+
+        has_uses = "uses" in step
+        has_run = "run" in step
+
+        if not has_uses and not has_run:
+            errors.append(f"Job '{job_id}', step {idx}: must have 'uses' or 'run'")
+
+        if has_uses and has_run:
+            errors.append(f"Job '{job_id}', step {idx}: cannot have both 'uses' and 'run'")
+
+    return errors
+
 
 class WorkflowValidator:
     """Validate GitHub Actions workflow files."""
 
-    def validate(self, workflow_path: Path) -> List[str]:
+    def validate(self, workflow_path: Union[Path, LoadedWorkflow]) -> List[str]:
         """Validate a workflow file and return list of errors.
 
         Args:
-            workflow_path: Path to the workflow YAML file
+            workflow_path: Path to the workflow YAML file, or an already
+                loaded workflow to reuse its parsed YAML
 
         Returns:
             List of error messages (empty if valid)
         """
-        errors = []
+        if isinstance(workflow_path, LoadedWorkflow):
+            loaded = workflow_path
+        else:
+            if not workflow_path.exists():
+                return [f"File not found: {workflow_path}"]
+            loaded = load(workflow_path)
+
+        if loaded.yaml_error is not None:
+            return [f"Invalid YAML syntax: {loaded.yaml_error}"]
 
-        if not workflow_path.exists():
-            return [f"File not found: {workflow_path}"]
+        return self._validate_document(loaded.raw_bytes, loaded.data)
 
-        # Read raw content for syntax checks
-        with open(workflow_path, "r") as f:
-            raw_content = f.read()
+    def validate_string(self, text: str) -> List[str]:
+        """Validate workflow YAML from a string and return list of errors.
+
+        Args:
+            text: Workflow YAML content
 
+        Returns:
+            List of error messages (empty if valid)
+        """
         try:
-            data = yaml.safe_load(raw_content)
+            data = load_yaml_text(text)
         except yaml.YAMLError as e:
             return [f"Invalid YAML syntax: {e}"]
 
+        return self._validate_document(text.encode("utf-8"), data)
+
+    def _validate_document(self, raw_content: bytes, data: Any) -> List[str]:
+        """Validate a parsed workflow document.
+
+        Args:
+            raw_content: Raw YAML content, kept for syntax checks
+            data: Parsed YAML document
+
+        Returns:
+            List of error messages (empty if valid)
+        """
+        errors = []
+
         if not isinstance(data, dict):
             return ["Workflow must be a YAML dictionary"]
 
@@ -62,35 +132,24 @@ class WorkflowValidator:
             if not job_data["steps"]:
                 errors.append(f"Job '{job_id}' must have at least one step")
 
-            for idx, step in enumerate(job_data["steps"]):
-                if not isinstance(step, dict):
-                    errors.append(f"Job '{job_id}', step {idx}: must be a dictionary")
-                    continue
-
-                has_uses = "uses" in step
-                has_run = "run" in step
-
-                if not has_uses and not has_run:
-                    errors.append(f"Job '{job_id}', step {idx}: must have 'uses' or 'run'")
-
-                if has_uses and has_run:
-                    errors.append(f"Job '{job_id}', step {idx}: cannot have both 'uses' and 'run'")
+            errors.extend(_validate_steps(job_id, job_data["steps"]))
 
         self._validate_syntax_patterns(raw_content, data, errors)
 
         return errors
 
-    def _validate_syntax_patterns(self, raw_content: str, data: dict, errors: List[str]) -> None:
+    def _validate_syntax_patterns(self, raw_content: bytes, data: dict, errors: List[str]) -> None:
         """Check for common syntax mistakes.
 
         Args:
-            raw_content: Raw YAML content as string
+            raw_content: Raw YAML content as bytes
             data: Parsed workflow YAML
             errors: List to append errors to
         """
-        # Check for malformed GitHub expressions (no space)
-        if "${{}}" in raw_content:
-            errors.append("Syntax hint: GitHub expressions use '${{ }}' not '${{}}'")
+        found = {match.lastgroup for match in _SYNTAX_RE.finditer(raw_content)}
+        for name, message in _SYNTAX_HINTS.items():
+            if name in found:
+                errors.append(message)
 
         if "on" not in data and True not in data:
             errors.append("Warning: Missing 'on:' trigger configuration")
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from gha_debug.parser import WorkflowParser
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _preload_cli():
+    """Import the CLI and its lazily-loaded command modules once per session.
+
+    ``gha_debug.cli`` defers these imports to each command body, so without
+    this the first test to invoke each command pays for the import.
+    """
+    from gha_debug import cli, formatter, parser, report, runner, validator  # noqa: F401
+
+
+@pytest.fixture(scope="module")
+def simple_workflow_yaml():
+    """Single-job workflow YAML with workflow and job env vars."""
+    return """
+name: Test Workflow
+on: [push]
+env:
+  GLOBAL_VAR: global_value
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    env:
+      JOB_VAR: job_value
+    steps:
+      - name: Checkout
+        uses: actions/checkout@v3
+      - name: Echo test
+        run: echo "test"
+    """
+
+
+@pytest.fixture(scope="module")
+def simple_workflow(simple_workflow_yaml):
+    """The simple workflow, parsed once per test module."""
+    return WorkflowParser.parse_string(simple_workflow_yaml)
+
+
+@pytest.fixture(scope="session")
+def click_runner():
+    """One CliRunner for the whole session; each invoke is isolated anyway."""
+    from click.testing import CliRunner
+
+    return CliRunner()
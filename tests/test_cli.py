@@ -1,57 +1,54 @@
 """Unit tests for CLI interface."""
 
-import tempfile
+import re
+import subprocess
+import sys
 from pathlib import Path
 
-from click.testing import CliRunner
-
 from gha_debug.cli import cli
 
+_OK_RE = re.compile(r"Test Workflow|OK")
+
 
-def test_cli_version():
+def test_cli_version(click_runner):
     """Test CLI version option."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--version"])
+    result = click_runner.invoke(cli, ["--version"])
 
     assert result.exit_code == 0
     assert "version" in result.output.lower()
 
 
-def test_cli_help():
+def test_cli_help(click_runner):
     """Test CLI help option."""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--help"])
+    result = click_runner.invoke(cli, ["--help"])
 
     assert result.exit_code == 0
     assert "Debug GitHub Actions" in result.output
 
 
-def test_run_command():
-    """Test run command with valid workflow."""
-    workflow_yaml = """
-name: Test Workflow
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - run: echo "test"
-    """
+def test_cli_import_is_lazy():
+    """Test importing the CLI does not load subcommand dependencies."""
+    code = (
+        "import sys, gha_debug.cli; "
+        "print(sorted(m for m in ('yaml', 'subprocess', 'gha_debug.runner') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run", str(temp_path)])
+def test_run_command(tmp_path, simple_workflow_yaml, click_runner):
+    """Test run command with valid workflow."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(simple_workflow_yaml)
+
+    result = click_runner.invoke(cli, ["run", str(temp_path)])
 
-        assert result.exit_code == 0
-        assert "Test Workflow" in result.output or "OK" in result.output
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert _OK_RE.search(result.output)
 
 
-def test_run_command_with_job_filter():
+def test_run_command_with_job_filter(tmp_path, click_runner):
     """Test run command with specific job."""
     workflow_yaml = """
 name: Multi-job Workflow
@@ -66,124 +63,90 @@ jobs:
       - run: echo "test"
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(workflow_yaml)
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run", str(temp_path), "--job", "test"])
+    result = click_runner.invoke(cli, ["run", str(temp_path), "--job", "test"])
 
-        assert result.exit_code == 0
-        assert "Multi-job Workflow" in result.output or "OK" in result.output
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert _OK_RE.search(result.output)
 
 
-def test_run_command_verbose():
+def test_run_command_verbose(tmp_path, simple_workflow_yaml, click_runner):
     """Test run command with verbose flag."""
-    workflow_yaml = """
-name: Test Workflow
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - run: echo "verbose test"
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(simple_workflow_yaml)
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run", str(temp_path), "--verbose"])
+    result = click_runner.invoke(cli, ["run", str(temp_path), "--verbose"])
 
-        assert result.exit_code == 0
-        assert "Test Workflow" in result.output or "OK" in result.output
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert _OK_RE.search(result.output)
 
 
-def test_list_command():
+def test_list_command(tmp_path, simple_workflow_yaml, click_runner):
     """Test list command with workflow file."""
-    workflow_yaml = """
-name: Test Workflow
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      - run: pytest
-    """
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(simple_workflow_yaml)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    result = click_runner.invoke(cli, ["list", str(temp_path)])
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["list", str(temp_path)])
-
-        assert result.exit_code == 0
-        assert "Test Workflow" in result.output
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert "Test Workflow" in result.output
 
 
-def test_list_command_directory():
+def test_list_command_directory(tmp_path, simple_workflow_yaml, click_runner):
     """Test list command with directory."""
-    workflow_yaml = """
-name: Test Workflow
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - run: echo "test"
-    """
+    workflow_file = tmp_path / "test.yml"
+    workflow_file.write_text(simple_workflow_yaml)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        workflow_file = Path(temp_dir) / "test.yml"
-        workflow_file.write_text(workflow_yaml)
+    result = click_runner.invoke(cli, ["list", str(tmp_path)])
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["list", temp_dir])
-
-        assert result.exit_code == 0
-        assert "Test Workflow" in result.output or "test.yml" in result.output
+    assert result.exit_code == 0
+    assert _OK_RE.search(result.output)
 
 
-def test_env_command():
+def test_env_command(tmp_path, simple_workflow_yaml, click_runner):
     """Test env command."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(simple_workflow_yaml)
+
+    result = click_runner.invoke(cli, ["env", str(temp_path)])
+
+    assert result.exit_code == 0
+    assert "GLOBAL_VAR" in result.output or "Environment" in result.output
+
+
+def test_validate_command_valid(tmp_path, simple_workflow_yaml, click_runner):
+    """Test validate command with valid workflow."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(simple_workflow_yaml)
+
+    result = click_runner.invoke(cli, ["validate", str(temp_path)])
+
+    assert result.exit_code == 0
+    assert "OK" in result.output or "valid" in result.output.lower()
+
+
+def test_validate_command_invalid(tmp_path, click_runner):
+    """Test validate command with invalid workflow."""
     workflow_yaml = """
-name: Test Workflow
-env:
-  GLOBAL_VAR: global_value
+name: Invalid Workflow
 jobs:
   test:
     runs-on: ubuntu-latest
-    env:
-      JOB_VAR: job_value
-    steps:
-      - run: echo "test"
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(workflow_yaml)
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["env", str(temp_path)])
+    result = click_runner.invoke(cli, ["validate", str(temp_path)])
 
-        assert result.exit_code == 0
-        assert "GLOBAL_VAR" in result.output or "Environment" in result.output
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 1
+    assert "steps" in result.output.lower() or "error" in result.output.lower()
 
 
-def test_validate_command_valid():
-    """Test validate command with valid workflow."""
+def test_validate_command_directory(tmp_path, click_runner):
+    """Test validate command with a directory of workflows."""
     workflow_yaml = """
 name: Valid Workflow
 on: [push]
@@ -191,42 +154,46 @@ jobs:
   test:
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
       - run: echo "test"
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    (tmp_path / "a.yml").write_text(workflow_yaml)
+    (tmp_path / "b.yaml").write_text(workflow_yaml)
+    (tmp_path / "notes.txt").write_text("not a workflow")
+    (tmp_path / "nested.yml").mkdir()
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["validate", str(temp_path)])
+    result = click_runner.invoke(cli, ["validate", str(tmp_path)])
 
-        assert result.exit_code == 0
-        assert "OK" in result.output or "valid" in result.output.lower()
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert "a.yml" in result.output
+    assert "b.yaml" in result.output
+    assert "notes.txt" not in result.output
+    assert "nested.yml" not in result.output
 
 
-def test_validate_command_invalid():
-    """Test validate command with invalid workflow."""
+def test_validate_command_html(tmp_path, monkeypatch, click_runner):
+    """Test validate command HTML report includes workflow structure."""
     workflow_yaml = """
-name: Invalid Workflow
+name: Report Workflow
+on: [push]
 jobs:
-  test:
+  build:
     runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v3
+      - run: make build
     """
+    opened = []
+    monkeypatch.setattr("webbrowser.open", opened.append)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    workflow_file = tmp_path / "report.yml"
+    workflow_file.write_text(workflow_yaml)
 
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["validate", str(temp_path)])
+    result = click_runner.invoke(cli, ["validate", str(workflow_file), "--html"])
 
-        assert result.exit_code == 1
-        assert "steps" in result.output.lower() or "error" in result.output.lower()
-    finally:
-        temp_path.unlink()
+    assert result.exit_code == 0
+    assert len(opened) == 1
+    html = Path(opened[0][len("file://"):]).read_text(encoding="utf-8")
+    assert "Report Workflow" in html
+    assert "actions/checkout@v3" in html
+    assert "make build" in html
@@ -1,6 +1,6 @@
 """Unit tests for YAML parsing."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -8,40 +8,13 @@ import pytest
 from gha_debug.parser import WorkflowParser
 
 
-def test_parse_valid_workflow():
-    """Test parsing a valid workflow file."""
-    workflow_yaml = """
-name: Test Workflow
-on: [push]
-env:
-  GLOBAL_VAR: global_value
-
-jobs:
-  test:
-    name: Test Job
-    runs-on: ubuntu-latest
-    steps:
-      - name: Checkout
-        uses: actions/checkout@v3
-      - name: Run tests
-        run: pytest
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-
-        assert workflow["name"] == "Test Workflow"
-        assert "GLOBAL_VAR" in workflow["env"]
-        assert len(workflow["jobs"]) == 1
-        assert workflow["jobs"][0]["id"] == "test"
-        assert len(workflow["jobs"][0]["steps"]) == 2
-    finally:
-        temp_path.unlink()
+def test_parse_valid_workflow(simple_workflow):
+    """Test parsing a valid workflow."""
+    assert simple_workflow["name"] == "Test Workflow"
+    assert "GLOBAL_VAR" in simple_workflow["env"]
+    assert len(simple_workflow["jobs"]) == 1
+    assert simple_workflow["jobs"][0]["id"] == "test"
+    assert len(simple_workflow["jobs"][0]["steps"]) == 2
 
 
 def test_parse_missing_file():
@@ -54,23 +27,19 @@ def test_parse_missing_file():
     assert "/nonexistent/file.yml" in str(exc_info.value)
 
 
-def test_parse_invalid_yaml():
+def test_parse_invalid_yaml(tmp_path):
     """Test parsing invalid YAML."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write("invalid: yaml: content: [")
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("invalid: yaml: content: [")
 
-    try:
-        parser = WorkflowParser(temp_path)
-        with pytest.raises(ValueError) as exc_info:
-            parser.parse()
-        assert "Invalid YAML" in str(exc_info.value)
-        assert "workflow file" in str(exc_info.value)
-    finally:
-        temp_path.unlink()
+    parser = WorkflowParser(temp_path)
+    with pytest.raises(ValueError) as exc_info:
+        parser.parse()
+    assert "Invalid YAML" in str(exc_info.value)
+    assert "workflow file" in str(exc_info.value)
 
 
-def test_get_job():
+def test_get_job(tmp_path):
     """Test retrieving a specific job."""
     workflow_yaml = """
 name: Multi-job Workflow
@@ -85,18 +54,248 @@ jobs:
       - run: echo test
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(workflow_yaml)
+
+    parser = WorkflowParser(temp_path)
+    workflow = parser.parse()
+
+    build_job = parser.get_job(workflow, "build")
+    assert build_job["id"] == "build"
+
+    with pytest.raises(ValueError):
+        parser.get_job(workflow, "nonexistent")
+
+
+def test_parse_picks_up_file_changes(tmp_path):
+    """Test that an edited workflow file is parsed again."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: First\njobs: {}\n")
+
+    parser = WorkflowParser(temp_path)
+    assert parser.parse()["name"] == "First"
+    assert parser.parse()["name"] == "First"
+
+    temp_path.write_text("name: Second Edit\njobs: {}\n")
+    assert parser.parse()["name"] == "Second Edit"
+
+
+def test_parse_results_are_independent(tmp_path):
+    """Test that mutating a parsed workflow doesn't affect later parses."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: Shared\nenv:\n  A: a\njobs:\n  test:\n    env:\n      B: b\n    steps:\n      - run: echo hi\n")
+
+    parser = WorkflowParser(temp_path)
+    first = parser.parse()
+    first["env"]["X"] = "leak"
+    first["jobs"][0]["env"]["X"] = "leak"
+
+    second = parser.parse()
+    assert second["env"] == {"A": "a"}
+    assert second["jobs"][0]["env"] == {"B": "b"}
+
+
+def test_parse_job_needs():
+    """Test parsing job dependencies."""
+    workflow_yaml = """
+name: Pipeline
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo build
+  test:
+    needs: build
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo test
+  deploy:
+    needs: [build, test]
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo deploy
+    """
+
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+
+    needs = {job["id"]: job["needs"] for job in workflow["jobs"]}
+    assert needs == {"build": [], "test": ["build"], "deploy": ["build", "test"]}
+
+
+def test_parse_job_needs_empty_or_scalar():
+    """Test that an empty or non-string scalar needs doesn't break parsing."""
+    workflow_yaml = """
+name: Pipeline
+jobs:
+  build:
+    needs:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo build
+  test:
+    needs: 3
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo test
+    """
+
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+
+    needs = {job["id"]: job["needs"] for job in workflow["jobs"]}
+    assert needs == {"build": [], "test": [3]}
+
+
+def test_parse_loaded_workflow(tmp_path):
+    """Test that parser and validator can share one loaded workflow."""
+    from gha_debug._loader import load
+    from gha_debug.validator import WorkflowValidator
+
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: Shared\non: [push]\njobs:\n  test:\n    steps:\n      - run: echo hi\n")
+
+    loaded = load(temp_path)
+
+    assert WorkflowValidator().validate(loaded) == []
+    workflow = WorkflowParser(loaded).parse()
+    assert workflow["name"] == "Shared"
+    assert workflow["jobs"][0]["steps"][0]["run"] == "echo hi"
+
+    temp_path.write_text("invalid: [yaml")
+    loaded = load(temp_path)
+    assert loaded.yaml_error is not None
+    with pytest.raises(ValueError):
+        WorkflowParser(loaded).parse()
+
+
+def test_parse_step_name_fallback():
+    """Test step names fall back to uses, then run, then a placeholder."""
+    workflow_yaml = """
+name: Names
+jobs:
+  test:
+    steps:
+      - name: Named
+        run: echo named
+      - uses: actions/checkout@v3
+      - run: echo unnamed
+      - name: ""
+        run: echo empty-name
+      - env:
+          FOO: bar
+    """
+
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    names = [step["name"] for step in workflow["jobs"][0]["steps"]]
+    assert names == ["Named", "actions/checkout@v3", "echo unnamed", "echo empty-name", "Unnamed step"]
+
+
+def test_parse_string():
+    """Test parsing workflow YAML held in memory."""
+    workflow = WorkflowParser.parse_string("jobs:\n  test:\n    steps:\n      - run: echo hi\n")
+
+    assert workflow["name"] == "workflow"
+    assert workflow["jobs"][0]["steps"][0]["run"] == "echo hi"
+
+    with pytest.raises(ValueError) as exc_info:
+        WorkflowParser.parse_string("invalid: yaml: content: [")
+    assert "Invalid YAML" in str(exc_info.value)
+
+
+def test_parse_string_reuses_parsed_yaml():
+    """Test that identical YAML text is only parsed once."""
+    from gha_debug._yamlcache import load_yaml_text
+
+    text = (
+        "name: Cached\nenv:\n  A: a\njobs:\n  test:\n    runs-on: [self-hosted, linux]\n    steps:\n"
+        "      - run: echo hi\n        env:\n          B: b\n"
+    )
+    first = WorkflowParser.parse_string(text)
+    hits = load_yaml_text.cache_info().hits
+
+    second = WorkflowParser.parse_string(text)
+
+    assert load_yaml_text.cache_info().hits == hits + 1
+    assert second == first
+    assert second is not first
+
+    # Mutating one result must not leak into the shared cached document
+    first["env"]["LEAK"] = "1"
+    first["jobs"][0]["steps"][0]["env"]["LEAK"] = "1"
+    first["jobs"][0]["runs-on"].append("leak")
+    third = WorkflowParser.parse_string(text)
+    assert "LEAK" not in second["env"]
+    assert "LEAK" not in third["env"]
+    assert third["jobs"][0]["steps"][0]["env"] == {"B": "b"}
+    assert third["jobs"][0]["runs-on"] == ["self-hosted", "linux"]
+
+
+def test_parse_json_cache(tmp_path, monkeypatch):
+    """Test the opt-in JSON sidecar cache is written, reused and refreshed."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: Cached\njobs:\n  test:\n    steps:\n      - run: echo hi\n")
+    cache_path = tmp_path / "workflow.yml.cache.json"
+
+    WorkflowParser(temp_path).parse()
+    assert not cache_path.exists()
+
+    monkeypatch.setenv("GHA_DEBUG_CACHE", "1")
+    first = WorkflowParser(temp_path).parse()
+    assert cache_path.exists()
+
+    second = WorkflowParser(temp_path).parse()
+    assert second == first
+    assert second["jobs_by_id"]["test"] is second["jobs"][0]
+
+    # A workflow edited after the sidecar was written is parsed again
+    temp_path.write_text("name: Edited\njobs: {}\n")
+    stat = cache_path.stat()
+    os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert WorkflowParser(temp_path).parse()["name"] == "Edited"
+
+
+@pytest.mark.parametrize(
+    "sidecar",
+    [
+        pytest.param("not json", id="invalid-json"),
+        pytest.param("{}", id="empty-object"),
+        pytest.param("[]", id="list"),
+        pytest.param('{"name": "Old", "env": {}, "jobs": []}', id="unversioned"),
+        pytest.param('{"version": 1, "workflow": {"name": "Broken", "env": {}}}', id="missing-jobs"),
+        pytest.param('{"version": 1, "workflow": {"name": "Broken", "env": {}, "jobs": [1]}}', id="bad-job"),
+        pytest.param('{"version": 1, "workflow": {"name": "Broken", "env": {}, "jobs": [{"id": "a"}]}}', id="partial-job"),
+    ],
+)
+def test_parse_json_cache_ignores_bad_sidecar(tmp_path, monkeypatch, sidecar):
+    """Test that a malformed or outdated sidecar falls back to parsing YAML."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: Fresh\njobs:\n  test:\n    steps:\n      - run: echo hi\n")
+    cache_path = tmp_path / "workflow.yml.cache.json"
+    cache_path.write_text(sidecar)
+    stat = temp_path.stat()
+    os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    monkeypatch.setenv("GHA_DEBUG_CACHE", "1")
+
+    workflow = WorkflowParser(temp_path).parse()
+
+    assert workflow["name"] == "Fresh"
+    assert [job["id"] for job in workflow["jobs"]] == ["test"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["workflow.yml", "workflow.yml.cache.json"]
+
+
+def test_parse_json_cache_reused_for_unusual_values(tmp_path, monkeypatch):
+    """Test that a numeric name and an empty env still hit the sidecar."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text("name: 2024\nenv:\njobs:\n  test:\n    env:\n    steps:\n      - run: echo hi\n        env:\n")
+    cache_path = tmp_path / "workflow.yml.cache.json"
+    monkeypatch.setenv("GHA_DEBUG_CACHE", "1")
 
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
+    first = WorkflowParser(temp_path).parse()
+    inode = cache_path.stat().st_ino
 
-        build_job = parser.get_job(workflow, "build")
-        assert build_job["id"] == "build"
+    second = WorkflowParser(temp_path).parse()
 
-        with pytest.raises(ValueError):
-            parser.get_job(workflow, "nonexistent")
-    finally:
-        temp_path.unlink()
+    assert first["name"] == 2024
+    assert first["env"] == {} and first["jobs"][0]["env"] == {}
+    assert first["jobs"][0]["steps"][0]["env"] == {}
+    assert second == first
+    assert cache_path.stat().st_ino == inode
@@ -0,0 +1,65 @@
+"""Unit tests for HTML report generation."""
+
+from gha_debug.report import export_html, generate_html
+
+
+def _result(**overrides):
+    result = {
+        "file": ".github/workflows/test.yml",
+        "name": "Test Workflow",
+        "valid": True,
+        "errors": [],
+        "jobs": [{
+            "name": "test",
+            "runs_on": "ubuntu-latest",
+            "steps": [
+                {"name": "Checkout", "uses": "actions/checkout@v3", "run": ""},
+                {"name": "Test", "uses": "", "run": "pytest"},
+            ],
+        }],
+    }
+    result.update(overrides)
+    return result
+
+
+def test_generate_html_summary():
+    """Test report summary and workflow structure."""
+    html = generate_html([_result(), _result(name="Broken", valid=False, errors=["Missing 'jobs'"])])
+
+    assert "1 FAILED" in html
+    assert "Test Workflow" in html
+    assert "actions/checkout@v3" in html
+    assert "pytest" in html
+    assert "Missing &#x27;jobs&#x27;" in html
+
+
+def test_generate_html_escapes_fields():
+    """Test that workflow content cannot inject markup into the report."""
+    result = _result(
+        name="<script>alert(1)</script>",
+        valid=False,
+        errors=["Bad <b>step</b>"],
+        jobs=[{
+            "name": "a&b",
+            "runs_on": "ubuntu-latest",
+            "steps": [{"name": "x", "uses": "", "run": 'echo "<img src=x>"'}],
+        }],
+    )
+
+    html = generate_html([result])
+
+    assert "<script>alert" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "Bad &lt;b&gt;step&lt;/b&gt;" in html
+    assert "a&amp;b" in html
+    assert "echo &quot;&lt;img src=x&gt;&quot;" in html
+
+
+def test_export_html(tmp_path):
+    """Test writing the report to a file."""
+    output_path = tmp_path / "report.html"
+
+    path = export_html([_result()], str(output_path))
+
+    assert path == str(output_path)
+    assert output_path.read_text(encoding="utf-8").startswith("<!DOCTYPE html>")
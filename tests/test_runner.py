@@ -1,46 +1,39 @@
 """Unit tests for workflow runner."""
 
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from gha_debug.parser import WorkflowParser
 from gha_debug.runner import WorkflowRunner
 
 
-def test_run_workflow_success():
-    """Test running a successful workflow."""
-    workflow_yaml = """
+@pytest.fixture
+def fake_popen():
+    """Patch the runner's Popen so shell steps don't fork real processes.
+
+    The fake process prints nothing and exits 0; tests adjust ``stdout`` and
+    ``wait.return_value`` on ``fake_popen.process`` as needed.
+    """
+    with patch("gha_debug.runner.subprocess.Popen") as popen:
+        process = popen.return_value.__enter__.return_value
+        process.stdout = []
+        process.wait.return_value = 0
+        popen.process = process
+        yield popen
+
+
+CHECKOUT_AND_ECHO_WORKFLOW = """
 name: Test Workflow
 jobs:
   test:
     runs-on: ubuntu-latest
     steps:
-      - name: Echo test
-        run: echo "test"
-      - name: True command
-        run: "true"
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=False)
-
-        result = runner.run()
-
-        assert result["success"] is True
-        assert result["total_time"] >= 0
-    finally:
-        temp_path.unlink()
-
+      - uses: actions/checkout@v3
+      - run: echo "test"
+"""
 
-def test_run_workflow_failure():
-    """Test running a workflow with failing step."""
-    workflow_yaml = """
+FAILING_WORKFLOW = """
 name: Test Workflow
 jobs:
   test:
@@ -48,29 +41,9 @@ jobs:
     steps:
       - name: Failing command
         run: exit 1
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=False)
-
-        result = runner.run()
-
-        assert result["success"] is False
-        assert "error" in result
-        assert result["total_time"] >= 0
-    finally:
-        temp_path.unlink()
+"""
 
-
-def test_run_specific_job():
-    """Test running a specific job by ID."""
-    workflow_yaml = """
+MULTI_JOB_WORKFLOW = """
 name: Multi-job Workflow
 jobs:
   build:
@@ -81,146 +54,301 @@ jobs:
     runs-on: ubuntu-latest
     steps:
       - run: echo "test"
-    """
+"""
+
+ACTION_WORKFLOW = """
+name: Test Workflow
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - name: Checkout
+        uses: actions/checkout@v3
+        with:
+          fetch-depth: 1
+"""
+
+
+@pytest.mark.parametrize(
+    "workflow_yaml, job_filter, verbose, expected_success, expected_commands",
+    [
+        pytest.param(CHECKOUT_AND_ECHO_WORKFLOW, None, False, True, ['echo "test"'], id="success"),
+        pytest.param(CHECKOUT_AND_ECHO_WORKFLOW, None, True, True, ['echo "test"'], id="verbose"),
+        pytest.param(FAILING_WORKFLOW, None, False, False, ["exit 1"], id="failure"),
+        pytest.param(MULTI_JOB_WORKFLOW, "test", False, True, ['echo "test"'], id="specific-job"),
+        pytest.param(ACTION_WORKFLOW, None, True, True, [], id="action-step"),
+    ],
+)
+def test_runner_scenarios(workflow_yaml, job_filter, verbose, expected_success, expected_commands, fake_popen):
+    """Test running workflows in the common success and failure scenarios."""
+    fake_popen.process.wait.return_value = 0 if expected_success else 1
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    runner = WorkflowRunner(workflow, verbose=verbose)
+
+    result = runner.run(job_filter=job_filter)
+
+    assert result["success"] is expected_success
+    assert result["total_time"] >= 0
+    assert [call.args[0] for call in fake_popen.call_args_list] == expected_commands
+    if not expected_success:
+        assert "error" in result
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
 
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=False)
+def test_run_nonexistent_job(simple_workflow):
+    """Test running a job that doesn't exist."""
+    runner = WorkflowRunner(simple_workflow, verbose=False)
 
-        result = runner.run(job_filter="test")
+    result = runner.run(job_filter="nonexistent")
 
-        assert result["success"] is True
-        assert result["total_time"] >= 0
-    finally:
-        temp_path.unlink()
+    assert result["success"] is False
+    assert "not found" in result["error"]
+    assert result["total_time"] == 0
 
 
-def test_run_nonexistent_job():
-    """Test running a job that doesn't exist."""
+def test_run_job_filter_without_index(fake_popen):
+    """Test that hand-built workflow dicts without jobs_by_id can be filtered."""
+    workflow = {
+        "name": "Hand-built",
+        "env": {},
+        "jobs": [
+            {"id": job_id, "name": job_id, "env": {}, "needs": [], "steps": [{"name": job_id, "run": f"echo {job_id}"}]}
+            for job_id in ("build", "test")
+        ],
+    }
+    runner = WorkflowRunner(workflow, verbose=False)
+
+    assert runner.run(job_filter="test")["success"] is True
+    assert fake_popen.call_count == 1
+    assert runner.run(job_filter="nonexistent")["success"] is False
+
+
+def test_step_environment_overlay(fake_popen):
+    """Test step env overrides job env without leaking into later steps."""
     workflow_yaml = """
 name: Test Workflow
+env:
+  GLOBAL_VAR: global_value
 jobs:
   test:
     runs-on: ubuntu-latest
+    env:
+      SHARED: job
     steps:
-      - run: echo "test"
+      - name: Step override
+        run: echo override
+        env:
+          SHARED: step
+          RETRIES: 3
+      - name: Job value restored
+        run: echo restored
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=False)
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    runner = WorkflowRunner(workflow, verbose=False)
 
-        result = runner.run(job_filter="nonexistent")
+    result = runner.run()
 
-        assert result["success"] is False
-        assert "not found" in result["error"]
-        assert result["total_time"] == 0
-    finally:
-        temp_path.unlink()
+    assert result["success"] is True
+    first_env, second_env = (call.kwargs["env"] for call in fake_popen.call_args_list)
+    assert first_env["SHARED"] == "step"
+    assert first_env["RETRIES"] == "3"
+    assert second_env["SHARED"] == "job"
+    assert "RETRIES" not in second_env
+    for env in (first_env, second_env):
+        assert env["GLOBAL_VAR"] == "global_value"
+        assert env["GITHUB_JOB"] == "test"
+        assert env["CI"] == "true"
 
 
-def test_run_action_step():
-    """Test running a step with uses (action)."""
+def test_failed_step_shows_output_tail(capsys, fake_popen):
+    """Test that a failing quiet step reports the end of its output."""
     workflow_yaml = """
 name: Test Workflow
 jobs:
   test:
     runs-on: ubuntu-latest
     steps:
-      - name: Checkout
-        uses: actions/checkout@v3
-        with:
-          fetch-depth: 1
+      - name: Noisy failure
+        run: ./noisy.sh
     """
+    fake_popen.process.stdout = [f"line {i}\n" for i in range(1, 101)] + ["boom\n"]
+    fake_popen.process.wait.return_value = 1
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=True)
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    runner = WorkflowRunner(workflow, verbose=False)
 
-        result = runner.run()
+    result = runner.run()
+    output = capsys.readouterr().out
 
-        assert result["success"] is True
-        assert result["total_time"] >= 0
-    finally:
-        temp_path.unlink()
+    assert result["success"] is False
+    assert "boom" in output
+    assert "line 100" in output
+    assert "line 1\n" not in output
 
 
-def test_environment_variables():
-    """Test environment variable handling."""
+def test_runner_integration_echo(capsys):
+    """Smoke test that really runs shell steps, including a failing one."""
     workflow_yaml = """
-name: Test Workflow
-env:
-  GLOBAL_VAR: global_value
+name: Integration
 jobs:
   test:
     runs-on: ubuntu-latest
     env:
-      JOB_VAR: job_value
+      GREETING: hello
     steps:
-      - name: Check env
-        run: test "$GLOBAL_VAR" = "global_value"
-        env:
-          STEP_VAR: step_value
+      - run: echo "$GREETING from the shell"
+      - run: echo "boom" >&2; exit 3
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    workflow = WorkflowParser.parse_string(workflow_yaml)
 
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner = WorkflowRunner(workflow, verbose=False)
+    result = WorkflowRunner(workflow, verbose=True).run()
+    output = capsys.readouterr().out
 
-        result = runner.run()
+    assert result["success"] is False
+    assert "hello from the shell" in output
+    assert "boom" in output
 
-        assert result["success"] is True
-        assert result["total_time"] >= 0
-    finally:
-        temp_path.unlink()
+
+def test_runner_undecodable_output(capsys):
+    """Test that a step printing non-UTF-8 bytes still succeeds."""
+    workflow_yaml = r"""
+name: Binary Output
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - run: printf 'ok\377\n'
+    """
+
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+
+    result = WorkflowRunner(workflow, verbose=True).run()
+    output = capsys.readouterr().out
+
+    assert result["success"] is True
+    assert "ok\ufffd" in output
+
+
+def test_run_independent_jobs_concurrently(tmp_path):
+    """Test that jobs without needs run at the same time."""
+    # Each job only succeeds if it sees the other job's marker file
+    workflow_yaml = f"""
+name: Parallel Workflow
+jobs:
+  left:
+    runs-on: ubuntu-latest
+    steps:
+      - run: touch {tmp_path}/left; for i in $(seq 50); do [ -f {tmp_path}/right ] && exit 0; sleep 0.1; done; exit 1
+  right:
+    runs-on: ubuntu-latest
+    steps:
+      - run: touch {tmp_path}/right; for i in $(seq 50); do [ -f {tmp_path}/left ] && exit 0; sleep 0.1; done; exit 1
+    """
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    result = WorkflowRunner(workflow, verbose=False).run()
+
+    assert result["success"] is True
 
 
-def test_verbose_output():
-    """Test verbose mode with actions and commands."""
+def test_run_jobs_output_order(capsys):
+    """Test that job output follows dependency order, not completion order."""
     workflow_yaml = """
-name: Test Workflow
+name: Ordered Output
 jobs:
-  test:
+  deploy:
+    needs: [slow]
     runs-on: ubuntu-latest
     steps:
-      - uses: actions/checkout@v3
-      - run: echo "verbose test"
+      - run: echo deploy-output
+  slow:
+    runs-on: ubuntu-latest
+    steps:
+      - run: sleep 0.3; echo slow-output
+  fast:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo fast-output
     """
+    workflow = WorkflowParser.parse_string(workflow_yaml)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+    result = WorkflowRunner(workflow, verbose=True).run()
+    output = capsys.readouterr().out
 
-    try:
-        parser = WorkflowParser(temp_path)
-        workflow = parser.parse()
-        runner_verbose = WorkflowRunner(workflow, verbose=True)
-        runner_quiet = WorkflowRunner(workflow, verbose=False)
+    assert result["success"] is True
+    assert output.index("slow-output") < output.index("fast-output") < output.index("deploy-output")
+
+
+def test_run_jobs_respect_needs(tmp_path):
+    """Test that a job waits for its needs and is skipped when they fail."""
+    workflow_yaml = f"""
+name: Pipeline
+jobs:
+  deploy:
+    needs: [build]
+    runs-on: ubuntu-latest
+    steps:
+      - run: test -f {tmp_path}/built && touch {tmp_path}/deployed
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - run: sleep 0.2 && touch {tmp_path}/built
+    """
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    assert WorkflowRunner(workflow, verbose=False).run()["success"] is True
+    assert (tmp_path / "deployed").exists()
+
+    (tmp_path / "deployed").unlink()
+    workflow = WorkflowParser.parse_string(workflow_yaml.replace("sleep 0.2 && touch", "exit 1 && touch"))
+    result = WorkflowRunner(workflow, verbose=False).run()
+    assert result["success"] is False
+    assert result["error"] == "Job 'build' failed"
+    assert not (tmp_path / "deployed").exists()
+
+
+def test_run_jobs_dependency_cycle():
+    """Test that jobs whose needs can never be met are reported."""
+    workflow_yaml = """
+name: Cycle
+jobs:
+  a:
+    needs: b
+    runs-on: ubuntu-latest
+    steps:
+      - run: "true"
+  b:
+    needs: a
+    runs-on: ubuntu-latest
+    steps:
+      - run: "true"
+    """
+    workflow = WorkflowParser.parse_string(workflow_yaml)
+    result = WorkflowRunner(workflow, verbose=False).run()
+
+    assert result["success"] is False
+    assert "unresolvable needs" in result["error"]
+
+
+def test_run_jobs_unknown_need(fake_popen):
+    """Test that a need naming no job in the workflow is reported up front."""
+    workflow_yaml = """
+name: Typo
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo build
+  deploy:
+    needs: [buidl]
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo deploy
+    """
+    workflow = WorkflowParser.parse_string(workflow_yaml)
 
-        result_verbose = runner_verbose.run()
-        result_quiet = runner_quiet.run()
+    result = WorkflowRunner(workflow, verbose=False).run()
 
-        assert result_verbose["success"] is True
-        assert result_quiet["success"] is True
-    finally:
-        temp_path.unlink()
+    assert result["success"] is False
+    assert result["error"] == "Job 'deploy' needs unknown job 'buidl'"
+    assert fake_popen.call_count == 0
+    assert WorkflowRunner(workflow, verbose=False).run(job_filter="deploy")["success"] is True
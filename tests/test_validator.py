@@ -1,14 +1,10 @@
 """Unit tests for validation logic."""
 
-import tempfile
-from pathlib import Path
+import pytest
 
 from gha_debug.validator import WorkflowValidator
 
-
-def test_validate_valid_workflow():
-    """Test validation of a valid workflow."""
-    workflow_yaml = """
+VALID_YAML = """
 name: Valid Workflow
 on: [push]
 jobs:
@@ -16,98 +12,74 @@ jobs:
     runs-on: ubuntu-latest
     steps:
       - uses: actions/checkout@v3
-      - run: echo "Hello"
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        validator = WorkflowValidator()
-        errors = validator.validate(temp_path)
-        assert len(errors) == 0
-        assert isinstance(errors, list)
-    finally:
-        temp_path.unlink()
-
+      - run: echo "test"
+"""
 
-def test_validate_missing_jobs():
-    """Test validation of workflow without jobs."""
-    workflow_yaml = """
+MISSING_JOBS_YAML = """
 name: Invalid Workflow
 on: [push]
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
+"""
 
-    try:
-        validator = WorkflowValidator()
-        errors = validator.validate(temp_path)
-        assert any("jobs" in error.lower() for error in errors)
-        assert len(errors) > 0
-    finally:
-        temp_path.unlink()
-
-
-def test_validate_missing_steps():
-    """Test validation of job without steps."""
-    workflow_yaml = """
+MISSING_STEPS_YAML = """
 name: Invalid Workflow
 jobs:
   test:
     runs-on: ubuntu-latest
-    """
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        validator = WorkflowValidator()
-        errors = validator.validate(temp_path)
-        assert any("steps" in error.lower() for error in errors)
-        assert len(errors) > 0
-    finally:
-        temp_path.unlink()
+"""
 
-
-def test_validate_step_without_action_or_run():
-    """Test validation of step without uses or run."""
-    workflow_yaml = """
+STEP_WITHOUT_ACTION_OR_RUN_YAML = """
 name: Invalid Workflow
 jobs:
   test:
     runs-on: ubuntu-latest
     steps:
       - name: Invalid step
+"""
+
+
+@pytest.mark.parametrize(
+    "yaml_text, expect_errors, expect_substr",
+    [
+        pytest.param(VALID_YAML, False, None, id="valid"),
+        pytest.param(MISSING_JOBS_YAML, True, "jobs", id="missing-jobs"),
+        pytest.param(MISSING_STEPS_YAML, True, "steps", id="missing-steps"),
+        pytest.param(STEP_WITHOUT_ACTION_OR_RUN_YAML, True, "must have 'uses' or 'run'", id="step-without-action-or-run"),
+        pytest.param("invalid: [yaml", True, "invalid yaml", id="invalid-yaml"),
+    ],
+)
+def test_validator(yaml_text, expect_errors, expect_substr):
+    """Test validation of valid and invalid workflows."""
+    errors = WorkflowValidator().validate_string(yaml_text)
+
+    assert isinstance(errors, list)
+    assert bool(errors) is expect_errors
+    if expect_substr:
+        assert any(expect_substr in error.lower() for error in errors)
+
+
+def test_validate_empty_expression_hint():
+    """Test syntax hint for an empty GitHub expression."""
+    workflow_yaml = """
+name: Hint Workflow
+on: [push]
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo "${{}}"
+      - run: echo "${{}}"
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(workflow_yaml)
-        temp_path = Path(f.name)
-
-    try:
-        validator = WorkflowValidator()
-        errors = validator.validate(temp_path)
-        assert any("uses" in error and "run" in error for error in errors)
-        assert len(errors) > 0
-    finally:
-        temp_path.unlink()
+    validator = WorkflowValidator()
+    errors = validator.validate_string(workflow_yaml)
+    assert errors == ["Syntax hint: GitHub expressions use '${{ }}' not '${{}}'"]
 
 
-def test_validate_invalid_yaml():
-    """Test validation of invalid YAML syntax."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write("invalid: [yaml")
-        temp_path = Path(f.name)
+def test_validate_file(tmp_path):
+    """Test validation of a workflow file on disk."""
+    temp_path = tmp_path / "workflow.yml"
+    temp_path.write_text(VALID_YAML)
 
-    try:
-        validator = WorkflowValidator()
-        errors = validator.validate(temp_path)
-        assert any("yaml" in error.lower() for error in errors)
-        assert len(errors) > 0
-    finally:
-        temp_path.unlink()
+    validator = WorkflowValidator()
+    assert validator.validate(temp_path) == []
+    assert validator.validate(tmp_path / "missing.yml") == [f"File not found: {tmp_path / 'missing.yml'}"]